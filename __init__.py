@@ -5,7 +5,7 @@ import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN
+from .const import DOMAIN, CONF_YEN_PER_KWH, DEFAULT_YEN_PER_KWH
 from .coordinator import OEJPCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -17,10 +17,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    # Recompute the cost values for a changed yen/kWh rate without reloading
+    # the entry or fetching again. The listener also fires when the cached
+    # token is persisted to entry.data; skip those so entities don't rewrite
+    # unchanged state.
+    coordinator: OEJPCoordinator = hass.data[DOMAIN][entry.entry_id]
+    yen_per_kwh = float(entry.options.get(CONF_YEN_PER_KWH, DEFAULT_YEN_PER_KWH))
+    if coordinator.data is not None and coordinator.data.get("yen_per_kwh") == yen_per_kwh:
+        return
+    coordinator.async_apply_options()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
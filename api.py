@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import base64
 import logging
+import sys
+from bisect import bisect_left
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone, date
-from decimal import Decimal
 from typing import Any
 
 from zoneinfo import ZoneInfo
 
+import orjson
+
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import DEFAULT_API_URL
@@ -15,6 +19,13 @@ from .const import DEFAULT_API_URL
 _LOGGER = logging.getLogger(__name__)
 JST = ZoneInfo("Asia/Tokyo")
 
+# Every poll re-reads from yesterday's JST midnight (roughly 48-96 readings),
+# and the whole window from last month's start is refetched once per JST day,
+# so revisions are picked up within a day. The lookback only moves the start
+# earlier than that when the last cached interval ends less than this far
+# after yesterday's midnight, i.e. when meter data is about 22h or more late.
+HH_REFETCH_LOOKBACK = timedelta(hours=2)
+
 
 class OEJPAuthError(Exception):
     pass
@@ -25,7 +36,7 @@ class OEJPApiError(Exception):
 
 
 def _parse_dt(s: str) -> datetime:
-    if s.endswith("Z"):
+    if sys.version_info < (3, 11) and s.endswith("Z"):
         s = s[:-1] + "+00:00"
     dt = datetime.fromisoformat(s)
     if dt.tzinfo is None:
@@ -33,16 +44,18 @@ def _parse_dt(s: str) -> datetime:
     return dt
 
 
+def _snippet(raw: bytes) -> str:
+    # Only the logged prefix is decoded, never the whole body.
+    return raw[:1200].decode("utf-8", "replace")
+
+
 def _jwt_exp(token: str) -> datetime | None:
     try:
-        import base64
-        import json
-
-        parts = token.split(".")
+        parts = token.encode("ascii").split(b".")
         if len(parts) != 3:
             return None
-        payload = parts[1] + "=" * (-len(parts[1]) % 4)
-        data = json.loads(base64.urlsafe_b64decode(payload.encode("utf-8")).decode("utf-8"))
+        payload = parts[1] + b"=" * (-len(parts[1]) % 4)
+        data = orjson.loads(base64.urlsafe_b64decode(payload))
         exp = data.get("exp")
         if isinstance(exp, (int, float)):
             return datetime.fromtimestamp(exp, tz=timezone.utc)
@@ -51,15 +64,72 @@ def _jwt_exp(token: str) -> datetime | None:
         return None
 
 
-@dataclass
+def _sum_windows(
+    start_s: list[float],
+    value: list[float],
+    today_s: float,
+    yday_s: float,
+    month_s: float,
+    prev_month_s: float,
+) -> tuple[float, float, float, float]:
+    # start_s is sorted ascending, so each window is a contiguous slice.
+    i_prev_month = bisect_left(start_s, prev_month_s)
+    i_month = bisect_left(start_s, month_s, i_prev_month)
+    i_yday = bisect_left(start_s, yday_s)
+    i_today = bisect_left(start_s, today_s, i_yday)
+
+    return (
+        sum(value[i_today:]),
+        sum(value[i_yday:i_today]),
+        sum(value[i_month:]),
+        sum(value[i_prev_month:i_month]),
+    )
+
+
+# Readings only ever carry a handful of distinct versions; sharing one string
+# per version avoids a fresh str() for every reading.
+_VERSIONS: dict[Any, str] = {}
+_VERSIONS_MAX = 64
+
+
+def _version_str(ver: Any) -> str:
+    ver_s = _VERSIONS.get(ver)
+    if ver_s is None:
+        ver_s = sys.intern(str(ver))
+        if len(_VERSIONS) < _VERSIONS_MAX:
+            _VERSIONS[ver] = ver_s
+    return ver_s
+
+
+@dataclass(slots=True, frozen=True)
 class HHReading:
     start_at: datetime
     end_at: datetime
     version: str | None
-    value: Decimal
+    value: float
+
 
+@dataclass(slots=True, frozen=True)
+class _WindowBounds:
+    day: date
+    prev_month_start: datetime
+    yday_start: datetime
+    prev_month_start_iso: str
+    yday_start_iso: str
+    today_s: float
+    yday_s: float
+    month_s: float
+    prev_month_s: float
 
-AUTH_MUTATION = """
+
+def _minify(query: str) -> str:
+    # None of the documents contain string literals, so collapsing whitespace
+    # is safe and trims the request body sent on every call.
+    return " ".join(query.split())
+
+
+AUTH_MUTATION = _minify(
+    """
 mutation obtainKrakenToken($input: ObtainJSONWebTokenInput!) {
   obtainKrakenToken(input: $input) {
     token
@@ -68,8 +138,10 @@ mutation obtainKrakenToken($input: ObtainJSONWebTokenInput!) {
   }
 }
 """
+)
 
-GET_ACCOUNT_BODY = """
+GET_ACCOUNT_BODY = _minify(
+    """
 query accountViewer {
   viewer {
     accounts {
@@ -78,8 +150,10 @@ query accountViewer {
   }
 }
 """
+)
 
-GET_HH_BODY = """
+GET_HH_BODY = _minify(
+    """
 query halfHourlyReadings($accountNumber: String!, $fromDatetime: DateTime, $toDatetime: DateTime) {
   account(accountNumber: $accountNumber) {
     properties {
@@ -95,18 +169,58 @@ query halfHourlyReadings($accountNumber: String!, $fromDatetime: DateTime, $toDa
   }
 }
 """
+)
+
+
+def _body_prefix(query: str) -> bytes:
+    return b'{"query":' + orjson.dumps(query) + b',"variables":'
+
+
+# The query documents never change, so their JSON encoding is done once here
+# and only the variables are serialized per request.
+_BODY_PREFIXES: dict[str, bytes] = {
+    q: _body_prefix(q) for q in (AUTH_MUTATION, GET_ACCOUNT_BODY, GET_HH_BODY)
+}
 
 
 class OEJPApi:
-    def __init__(self, hass, email: str, password: str, api_url: str | None = None):
+    def __init__(
+        self,
+        hass,
+        email: str,
+        password: str,
+        api_url: str | None = None,
+        access_token: str | None = None,
+        access_exp: datetime | None = None,
+        account_number: str | None = None,
+    ):
         self._hass = hass
         self._email = email
         self._password = password
         self._api_url = api_url or DEFAULT_API_URL
+        self._session = async_get_clientsession(hass)
+
+        # A cached token is only trusted when its expiry is known.
+        self._access_token: str | None = access_token if access_exp else None
+        self._access_exp: datetime | None = access_exp if access_token else None
+        self._account_number: str | None = account_number
+
+        self._hh_cache: dict[float, HHReading] = {}
+        self._hh_cursor: datetime | None = None
+        self._bounds: _WindowBounds | None = None
+        self._end_iso: dict[int, str] = {}
 
-        self._access_token: str | None = None
-        self._access_exp: datetime | None = None
-        self._account_number: str | None = None
+    @property
+    def access_token(self) -> str | None:
+        return self._access_token
+
+    @property
+    def access_exp(self) -> datetime | None:
+        return self._access_exp
+
+    @property
+    def account_number(self) -> str | None:
+        return self._account_number
 
     async def _post(
         self,
@@ -115,8 +229,6 @@ class OEJPApi:
         auth: str | None = None,
         tag: str = "graphql",
     ) -> dict[str, Any]:
-        session = async_get_clientsession(self._hass)
-
         headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
@@ -124,28 +236,35 @@ class OEJPApi:
         if auth:
             headers["authorization"] = auth
 
-        payload = {"query": query, "variables": variables or {}}
+        prefix = _BODY_PREFIXES.get(query)
+        if prefix is None:
+            prefix = _body_prefix(query)
+        payload = prefix + orjson.dumps(variables or {}) + b"}"
 
         _LOGGER.debug("OEJP request %s url=%s", tag, self._api_url)
 
-        async with session.post(self._api_url, json=payload, headers=headers) as resp:
+        async with self._session.post(self._api_url, data=payload, headers=headers) as resp:
             status = resp.status
-            text = await resp.text()
+            raw = await resp.read()
 
-        try:
-            import json as _json
+        # Decide the error class from the status first: a 401 from a proxy or
+        # gateway may not carry a JSON body, but must still trigger a re-login.
+        err_cls = OEJPAuthError if status == 401 else OEJPApiError
 
-            body = _json.loads(text)
-        except Exception:
-            _LOGGER.error("OEJP %s invalid_json http=%s body=%s", tag, status, text[:1200])
+        try:
+            body = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            _LOGGER.error("OEJP %s invalid_json http=%s body=%s", tag, status, _snippet(raw))
+            if status >= 400:
+                raise err_cls(f"HTTP {status} invalid JSON")
             raise OEJPApiError("Invalid JSON")
 
         if status >= 400:
             if body.get("errors"):
                 _LOGGER.error("OEJP %s http=%s graphql_errors=%s", tag, status, body.get("errors"))
-                raise OEJPApiError(f"HTTP {status} GraphQL errors: {body.get('errors')}")
-            _LOGGER.error("OEJP %s http=%s body=%s", tag, status, text[:1200])
-            raise OEJPApiError(f"HTTP {status}")
+                raise err_cls(f"HTTP {status} GraphQL errors: {body.get('errors')}")
+            _LOGGER.error("OEJP %s http=%s body=%s", tag, status, _snippet(raw))
+            raise err_cls(f"HTTP {status}")
 
         if body.get("errors"):
             msg = str(body.get("errors"))
@@ -156,7 +275,7 @@ class OEJPApi:
 
         data = body.get("data")
         if not isinstance(data, dict):
-            _LOGGER.error("OEJP %s missing_data body=%s", tag, str(body)[:1200])
+            _LOGGER.error("OEJP %s missing_data body=%s", tag, _snippet(raw))
             raise OEJPApiError("Missing data")
         return data
 
@@ -186,16 +305,31 @@ class OEJPApi:
                 _LOGGER.debug("OEJP token near expiry, re-login")
                 await self._login()
 
+        # The account lookup needs the JWT, so it cannot share a request with the
+        # login mutation; it only runs once per instance since the number is kept.
         if not self._account_number:
             await self._load_account_number()
 
-    async def _load_account_number(self) -> None:
+    async def _post_authed(
+        self, query: str, variables: dict[str, Any], tag: str
+    ) -> dict[str, Any]:
         assert self._access_token
-        data = await self._post(
-            GET_ACCOUNT_BODY,
-            auth=f"JWT {self._access_token}",
-            tag="accounts",
-        )
+        try:
+            return await self._post(
+                query, variables=variables, auth=f"JWT {self._access_token}", tag=tag
+            )
+        except OEJPAuthError:
+            # A cached token can be revoked before its exp; log in again once.
+            _LOGGER.debug("OEJP token rejected, re-login")
+            self._access_token = None
+            self._access_exp = None
+            await self._login()
+            return await self._post(
+                query, variables=variables, auth=f"JWT {self._access_token}", tag=tag
+            )
+
+    async def _load_account_number(self) -> None:
+        data = await self._post_authed(GET_ACCOUNT_BODY, {}, tag="accounts")
         accounts = (data.get("viewer") or {}).get("accounts") or []
         if not accounts:
             raise OEJPAuthError("No accounts found")
@@ -218,29 +352,52 @@ class OEJPApi:
             return date(d.year - 1, 12, 1)
         return date(d.year, d.month - 1, 1)
 
+    def _window_bounds(self, today: date) -> _WindowBounds:
+        # The JST day/month boundaries only move at midnight, so they are
+        # rebuilt once per day rather than on every poll.
+        bounds = self._bounds
+        if bounds is None or bounds.day != today:
+            today_mid = self._midnight_jst(today)
+            yday_start = today_mid - timedelta(days=1)
+            prev_month_start = self._midnight_jst(self._first_day_of_prev_month(today))
+            bounds = _WindowBounds(
+                day=today,
+                prev_month_start=prev_month_start,
+                yday_start=yday_start,
+                prev_month_start_iso=prev_month_start.astimezone(timezone.utc).isoformat(),
+                yday_start_iso=yday_start.astimezone(timezone.utc).isoformat(),
+                today_s=today_mid.timestamp(),
+                yday_s=yday_start.timestamp(),
+                month_s=self._midnight_jst(self._first_day_of_month(today)).timestamp(),
+                prev_month_s=prev_month_start.timestamp(),
+            )
+            self._bounds = bounds
+            # New JST day: refetch the whole window once to pick up revisions
+            # older than the per-poll refetch range.
+            self._hh_cursor = None
+        return bounds
+
     async def async_test_auth(self) -> None:
         await self._ensure_auth()
         now = datetime.now(tz=JST)
         start = now - timedelta(hours=1)
         _ = await self.async_get_hh_readings(start, now)
 
-    async def async_get_hh_readings(self, start_at: datetime, end_at: datetime) -> list[HHReading]:
+    async def async_get_hh_readings(
+        self, start_at: datetime, end_at: datetime, start_iso: str | None = None
+    ) -> list[HHReading]:
         await self._ensure_auth()
-        assert self._access_token
         assert self._account_number
 
+        if start_iso is None:
+            start_iso = start_at.astimezone(timezone.utc).isoformat()
         variables: dict[str, Any] = {
             "accountNumber": self._account_number,
-            "fromDatetime": start_at.astimezone(timezone.utc).isoformat(),
+            "fromDatetime": start_iso,
             "toDatetime": end_at.astimezone(timezone.utc).isoformat(),
         }
 
-        data = await self._post(
-            GET_HH_BODY,
-            variables=variables,
-            auth=f"JWT {self._access_token}",
-            tag="hh",
-        )
+        data = await self._post_authed(GET_HH_BODY, variables, tag="hh")
 
         try:
             props = data["account"]["properties"]
@@ -251,81 +408,116 @@ class OEJPApi:
                 raise OEJPApiError("No electricitySupplyPoints returned")
             raw = esp[0]["halfHourlyReadings"] or []
         except KeyError as e:
-            _LOGGER.error("OEJP hh response shape data=%s", str(data)[:1200])
+            _LOGGER.error("OEJP hh response shape data=%s", _snippet(orjson.dumps(data)))
             raise OEJPApiError(f"Unexpected response shape missing {e}") from e
 
         readings: list[HHReading] = []
         for r in raw:
             ver = r.get("version")
-            ver_s = str(ver) if ver is not None else None
+            ver_s = _version_str(ver) if ver is not None else None
             readings.append(
                 HHReading(
                     start_at=_parse_dt(r["startAt"]),
                     end_at=_parse_dt(r["endAt"]),
                     version=ver_s,
-                    value=Decimal(str(r["value"])),
+                    value=float(r["value"]),
                 )
             )
 
         readings.sort(key=lambda x: x.start_at)
         return readings
 
+    async def _async_update_hh_cache(
+        self, bounds: _WindowBounds, now: datetime
+    ) -> tuple[list[float], list[HHReading]]:
+        # Both window boundaries come pre-formatted from the day's bounds; only
+        # a cursor lagging behind yesterday's midnight needs formatting here.
+        start = bounds.prev_month_start
+        start_iso: str | None = bounds.prev_month_start_iso
+        if self._hh_cursor is not None:
+            lagged = self._hh_cursor - HH_REFETCH_LOOKBACK
+            if lagged >= bounds.yday_start:
+                start, start_iso = bounds.yday_start, bounds.yday_start_iso
+            elif lagged > bounds.prev_month_start:
+                start, start_iso = lagged, None
+
+        cache = self._hh_cache
+        for r in await self.async_get_hh_readings(start, now, start_iso):
+            cache[r.start_at.timestamp()] = r
+
+        floor = bounds.prev_month_s
+        for key in [k for k in cache if k < floor]:
+            del cache[key]
+
+        # The cache is keyed by start epoch seconds, so sorting the items
+        # orders the readings and yields their start times in one pass.
+        items = sorted(cache.items())
+        start_s = [k for k, _ in items]
+        readings = [r for _, r in items]
+        if readings:
+            self._hh_cursor = readings[-1].end_at
+        return start_s, readings
+
     async def async_get_dashboard(self) -> dict[str, Any]:
         now_jst = datetime.now(tz=JST)
+        bounds = self._window_bounds(now_jst.date())
 
-        today = now_jst.date()
-        today_mid = self._midnight_jst(today)
-        yday_mid = today_mid - timedelta(days=1)
-
-        month_start = self._midnight_jst(self._first_day_of_month(today))
-        prev_month_start = self._midnight_jst(self._first_day_of_prev_month(today))
-        prev_month_end = month_start
+        recent_s = (now_jst - timedelta(hours=12)).timestamp()
 
-        recent_start = now_jst - timedelta(hours=12)
+        start_s, range_months = await self._async_update_hh_cache(bounds, now_jst)
 
-        recent = await self.async_get_hh_readings(recent_start, now_jst)
-        range_months = await self.async_get_hh_readings(prev_month_start, now_jst)
+        # Aggregate over flat epoch-second / float columns rather than
+        # comparing aware datetimes per reading.
+        value = [r.value for r in range_months]
 
-        today_kwh = Decimal("0")
-        yday_kwh = Decimal("0")
-        mtd_kwh = Decimal("0")
-        last_month_kwh = Decimal("0")
+        today_kwh, yday_kwh, mtd_kwh, last_month_kwh = _sum_windows(
+            start_s,
+            value,
+            bounds.today_s,
+            bounds.yday_s,
+            bounds.month_s,
+            bounds.prev_month_s,
+        )
 
-        last_kwh: Decimal | None = None
-        last_end_jst: datetime | None = None
+        last_kwh: float | None = None
+        last_end_jst: str | None = None
 
-        for r in range_months:
-            st_jst = r.start_at.astimezone(JST)
-            if st_jst >= month_start:
-                mtd_kwh += r.value
-            elif st_jst >= prev_month_start and st_jst < prev_month_end:
-                last_month_kwh += r.value
+        # The last 12 hours are the tail of the sorted monthly slice.
+        recent = range_months[bisect_left(start_s, recent_s):]
 
-            if st_jst >= today_mid:
-                today_kwh += r.value
-            elif st_jst >= yday_mid and st_jst < today_mid:
-                yday_kwh += r.value
+        # Consecutive polls mostly share the same intervals, so the JST strings
+        # from the previous poll are reused and only new ends are formatted.
+        # Ends (epoch seconds and JST strings) and kWh are emitted as parallel
+        # lists sorted by end; the energy total sensor relies on both.
+        prev_iso = self._end_iso
+        end_iso: dict[int, str] = {}
+        recent_end_s: list[int] = []
+        recent_ends: list[str] = []
+        for r in recent:
+            end_s = int(r.end_at.timestamp())
+            end_jst = prev_iso.get(end_s)
+            if end_jst is None:
+                end_jst = r.end_at.astimezone(JST).isoformat()
+            end_iso[end_s] = end_jst
+            recent_end_s.append(end_s)
+            recent_ends.append(end_jst)
+        self._end_iso = end_iso
+        recent_kwhs = [r.value for r in recent]
 
         if recent:
-            last_kwh = recent[-1].value
-            last_end_jst = recent[-1].end_at.astimezone(JST)
-
-        recent_compact: list[dict[str, Any]] = []
-        for r in recent:
-            recent_compact.append(
-                {
-                    "end_jst": r.end_at.astimezone(JST).isoformat(),
-                    "kwh": float(r.value),
-                }
-            )
+            last_kwh = recent_kwhs[-1]
+            last_end_jst = recent_ends[-1]
 
         return {
             "account_number": self._account_number or "",
-            "today_kwh": float(today_kwh),
-            "yesterday_kwh": float(yday_kwh),
-            "month_to_date_kwh": float(mtd_kwh),
-            "last_month_kwh": float(last_month_kwh),
-            "last_half_hour_kwh": float(last_kwh) if last_kwh is not None else None,
-            "last_interval_end_jst": last_end_jst.isoformat() if last_end_jst else None,
-            "recent_readings": recent_compact,
+            # Float sums accumulate representation noise; round once here.
+            "today_kwh": round(today_kwh, 6),
+            "yesterday_kwh": round(yday_kwh, 6),
+            "month_to_date_kwh": round(mtd_kwh, 6),
+            "last_month_kwh": round(last_month_kwh, 6),
+            "last_half_hour_kwh": last_kwh,
+            "last_interval_end_jst": last_end_jst,
+            "recent_end_s": recent_end_s,
+            "recent_ends": recent_ends,
+            "recent_kwhs": recent_kwhs,
         }
@@ -13,6 +13,9 @@ from .const import (
     CONF_EMAIL,
     CONF_PASSWORD,
     CONF_API_URL,
+    CONF_ACCESS_TOKEN,
+    CONF_ACCESS_EXP,
+    CONF_ACCOUNT_NUMBER,
     CONF_YEN_PER_KWH,
     DEFAULT_API_URL,
     DEFAULT_YEN_PER_KWH,
@@ -21,7 +24,7 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
-async def _validate_input(hass: HomeAssistant, data: dict) -> None:
+async def _validate_input(hass: HomeAssistant, data: dict) -> OEJPApi:
     api = OEJPApi(
         hass=hass,
         email=data[CONF_EMAIL],
@@ -29,6 +32,7 @@ async def _validate_input(hass: HomeAssistant, data: dict) -> None:
         api_url=data.get(CONF_API_URL) or DEFAULT_API_URL,
     )
     await api.async_test_auth()
+    return api
 
 
 class OEJPConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -39,7 +43,7 @@ class OEJPConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             try:
-                await _validate_input(self.hass, user_input)
+                api = await _validate_input(self.hass, user_input)
                 await self.async_set_unique_id(f"oejp_{user_input[CONF_EMAIL].lower()}")
                 self._abort_if_unique_id_configured()
                 return self.async_create_entry(
@@ -48,6 +52,9 @@ class OEJPConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         CONF_EMAIL: user_input[CONF_EMAIL],
                         CONF_PASSWORD: user_input[CONF_PASSWORD],
                         CONF_API_URL: user_input.get(CONF_API_URL) or DEFAULT_API_URL,
+                        CONF_ACCESS_TOKEN: api.access_token,
+                        CONF_ACCESS_EXP: api.access_exp.timestamp() if api.access_exp else None,
+                        CONF_ACCOUNT_NUMBER: api.account_number,
                     },
                     options={
                         CONF_YEN_PER_KWH: float(DEFAULT_YEN_PER_KWH),
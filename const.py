@@ -5,8 +5,12 @@ DEFAULT_API_URL = "https://api.oejp-kraken.energy/v1/graphql/"
 CONF_EMAIL = "email"
 CONF_PASSWORD = "password"
 CONF_API_URL = "api_url"
+CONF_ACCESS_TOKEN = "access_token"
+CONF_ACCESS_EXP = "access_exp"
+CONF_ACCOUNT_NUMBER = "account_number"
 
 CONF_YEN_PER_KWH = "yen_per_kwh"
 
 DEFAULT_SCAN_INTERVAL_SECONDS = 900
+CACHED_TOKEN_MIN_VALIDITY_SECONDS = 300
 DEFAULT_YEN_PER_KWH = 0.0
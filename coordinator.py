@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import OEJPApi, OEJPApiError, OEJPAuthError
@@ -13,22 +14,87 @@ from .const import (
     CONF_EMAIL,
     CONF_PASSWORD,
     CONF_API_URL,
+    CONF_ACCESS_TOKEN,
+    CONF_ACCESS_EXP,
+    CONF_ACCOUNT_NUMBER,
+    CONF_YEN_PER_KWH,
     DEFAULT_API_URL,
     DEFAULT_SCAN_INTERVAL_SECONDS,
+    CACHED_TOKEN_MIN_VALIDITY_SECONDS,
+    DEFAULT_YEN_PER_KWH,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class OEJPCoordinator(DataUpdateCoordinator[dict]):
+def _safe_float(v) -> float | None:
+    t = type(v)
+    if t is float:
+        return v
+    if t is int:
+        return float(v)
+    if t is str:
+        try:
+            return float(v)
+        except ValueError:
+            return None
+    return None
+
+
+# Consumption and rates are non-negative, so adding 0.5 and truncating rounds
+# half up without going through round().
+def _compute_power(data: dict[str, Any], yen_per_kwh: float) -> float | None:
+    kwh = _safe_float(data.get("last_half_hour_kwh"))
+    if kwh is None:
+        return None
+    # kWh per half hour -> W, to one decimal place.
+    return int(kwh * 20000.0 + 0.5) / 10.0
+
+
+def _compute_today_cost(data: dict[str, Any], yen_per_kwh: float) -> int | None:
+    kwh = _safe_float(data.get("today_kwh"))
+    if kwh is None:
+        return None
+    return int(kwh * yen_per_kwh + 0.5)
+
+
+def _compute_mtd_cost(data: dict[str, Any], yen_per_kwh: float) -> int | None:
+    kwh = _safe_float(data.get("month_to_date_kwh"))
+    if kwh is None:
+        return None
+    return int(kwh * yen_per_kwh + 0.5)
+
+
+# Sensor values derived from the dashboard, computed once per update.
+_DERIVED: dict[str, Callable[[dict[str, Any], float], float | int | None]] = {
+    "last_half_hour_w": _compute_power,
+    "today_cost_yen": _compute_today_cost,
+    "month_to_date_cost_yen": _compute_mtd_cost,
+}
+
+
+class OEJPCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         self.entry = entry
 
+        cached_exp = entry.data.get(CONF_ACCESS_EXP)
+        access_exp: datetime | None = None
+        if isinstance(cached_exp, (int, float)):
+            access_exp = datetime.fromtimestamp(cached_exp, tz=timezone.utc)
+            min_exp = datetime.now(timezone.utc) + timedelta(
+                seconds=CACHED_TOKEN_MIN_VALIDITY_SECONDS
+            )
+            if access_exp <= min_exp:
+                access_exp = None
+
         self.api = OEJPApi(
             hass=hass,
             email=entry.data[CONF_EMAIL],
             password=entry.data[CONF_PASSWORD],
             api_url=entry.data.get(CONF_API_URL, DEFAULT_API_URL),
+            access_token=entry.data.get(CONF_ACCESS_TOKEN),
+            access_exp=access_exp,
+            account_number=entry.data.get(CONF_ACCOUNT_NUMBER),
         )
 
         super().__init__(
@@ -36,11 +102,16 @@ class OEJPCoordinator(DataUpdateCoordinator[dict]):
             logger=_LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL_SECONDS),
+            # Half-hourly data is often unchanged between polls; skip notifying
+            # entities (and their state writes) when the new data compares equal.
+            always_update=False,
         )
 
-    async def _async_update_data(self) -> dict:
+    async def _async_update_data(self) -> dict[str, Any]:
+        # Always returns a dict (or raises), so entities can rely on data
+        # being a mapping once the first refresh has completed.
         try:
-            return await self.api.async_get_dashboard()
+            data = await self.api.async_get_dashboard()
         except OEJPAuthError as err:
             raise UpdateFailed(str(err)) from err
         except OEJPApiError as err:
@@ -48,3 +119,40 @@ class OEJPCoordinator(DataUpdateCoordinator[dict]):
         except Exception as err:
             _LOGGER.exception("OEJP unexpected error")
             raise UpdateFailed(str(err)) from err
+
+        self._persist_auth()
+        self._add_derived(data)
+        return data
+
+    def _add_derived(self, data: dict[str, Any]) -> None:
+        yen_per_kwh = float(self.entry.options.get(CONF_YEN_PER_KWH, DEFAULT_YEN_PER_KWH))
+        data["yen_per_kwh"] = yen_per_kwh
+        for key, compute in _DERIVED.items():
+            data[key] = compute(data, yen_per_kwh)
+
+    @callback
+    def async_apply_options(self) -> None:
+        if self.data is not None:
+            data = dict(self.data)
+            self._add_derived(data)
+            self.data = data
+        self.async_update_listeners()
+
+    def _persist_auth(self) -> None:
+        token = self.api.access_token
+        account = self.api.account_number
+        if not token or (
+            token == self.entry.data.get(CONF_ACCESS_TOKEN)
+            and account == self.entry.data.get(CONF_ACCOUNT_NUMBER)
+        ):
+            return
+        exp = self.api.access_exp
+        self.hass.config_entries.async_update_entry(
+            self.entry,
+            data={
+                **self.entry.data,
+                CONF_ACCESS_TOKEN: token,
+                CONF_ACCESS_EXP: exp.timestamp() if exp else None,
+                CONF_ACCOUNT_NUMBER: account,
+            },
+        )
@@ -1,48 +1,43 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from bisect import bisect_right
 from datetime import datetime
-from typing import Any
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple
 
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, CONF_YEN_PER_KWH, DEFAULT_YEN_PER_KWH
+from .const import DOMAIN
 from .coordinator import OEJPCoordinator
 
+# Shared read-only stand-in for coordinator data (and the attributes derived
+# from it) before the first refresh.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
 
-def _safe_float(v) -> float | None:
-    try:
-        if v is None:
-            return None
-        return float(v)
-    except Exception:
-        return None
 
-
-@dataclass(frozen=True)
-class _SensorDef:
+class _SensorDef(NamedTuple):
     key: str
-    name: str
     device_class: SensorDeviceClass | None
     state_class: SensorStateClass | None
     unit: str | None
 
 
-SENSORS: list[_SensorDef] = [
-    _SensorDef("last_half_hour_kwh", "OEJP Last half hour", None, None, "kWh"),
-    _SensorDef("last_half_hour_w", "OEJP Power", SensorDeviceClass.POWER, SensorStateClass.MEASUREMENT, "W"),
-    _SensorDef("today_kwh", "OEJP Today", SensorDeviceClass.ENERGY, SensorStateClass.TOTAL, "kWh"),
-    _SensorDef("yesterday_kwh", "OEJP Yesterday", SensorDeviceClass.ENERGY, SensorStateClass.TOTAL, "kWh"),
-    _SensorDef("month_to_date_kwh", "OEJP Month to date", SensorDeviceClass.ENERGY, SensorStateClass.TOTAL, "kWh"),
-    _SensorDef("last_month_kwh", "OEJP Last month", SensorDeviceClass.ENERGY, SensorStateClass.TOTAL, "kWh"),
-    _SensorDef("today_cost_yen", "OEJP Cost today", SensorDeviceClass.MONETARY, SensorStateClass.TOTAL, "JPY"),
-    _SensorDef("month_to_date_cost_yen", "OEJP Cost month to date", SensorDeviceClass.MONETARY, SensorStateClass.TOTAL, "JPY"),
-]
+SENSORS: tuple[_SensorDef, ...] = (
+    _SensorDef("last_half_hour_kwh", None, None, "kWh"),
+    _SensorDef("last_half_hour_w", SensorDeviceClass.POWER, SensorStateClass.MEASUREMENT, "W"),
+    _SensorDef("today_kwh", SensorDeviceClass.ENERGY, SensorStateClass.TOTAL, "kWh"),
+    _SensorDef("yesterday_kwh", SensorDeviceClass.ENERGY, SensorStateClass.TOTAL, "kWh"),
+    _SensorDef("month_to_date_kwh", SensorDeviceClass.ENERGY, SensorStateClass.TOTAL, "kWh"),
+    _SensorDef("last_month_kwh", SensorDeviceClass.ENERGY, SensorStateClass.TOTAL, "kWh"),
+    _SensorDef("today_cost_yen", SensorDeviceClass.MONETARY, SensorStateClass.TOTAL, "JPY"),
+    _SensorDef("month_to_date_cost_yen", SensorDeviceClass.MONETARY, SensorStateClass.TOTAL, "JPY"),
+)
 
 
 async def async_setup_entry(
@@ -50,69 +45,87 @@ async def async_setup_entry(
 ) -> None:
     coordinator: OEJPCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[SensorEntity] = []
-    for s in SENSORS:
-        entities.append(OEJPSensor(coordinator, s))
-
+    entities: list[SensorEntity] = [OEJPSensor(coordinator, s) for s in SENSORS]
     entities.append(OEJPCumulativeEnergy(coordinator))
 
     async_add_entities(entities)
 
 
 class OEJPSensor(CoordinatorEntity[OEJPCoordinator], SensorEntity):
+    # Entity bases keep a __dict__ for the _attr_* fields; only the
+    # integration's own per-instance state is slotted.
+    __slots__ = ("_sdef", "_key", "_data", "_attrs")
+
+    # Names come from translations/en.json via the sensor key.
+    _attr_has_entity_name = True
+
     def __init__(self, coordinator: OEJPCoordinator, sdef: _SensorDef) -> None:
         super().__init__(coordinator)
+        # Static metadata is served from the shared _SensorDef instead of being
+        # copied into per-instance _attr_* fields.
+        self._sdef = sdef
         self._key = sdef.key
-        self._attr_name = sdef.name
-        self._attr_unique_id = f"{coordinator.entry.entry_id}_{self._key}"
 
-        self._attr_device_class = sdef.device_class
-        self._attr_state_class = sdef.state_class
-        self._attr_native_unit_of_measurement = sdef.unit
+        self._data: Mapping[str, Any] = coordinator.data or _EMPTY
+        self._attrs = self._build_attrs()
+
+    @cached_property
+    def unique_id(self) -> str:
+        return f"{self.coordinator.entry.entry_id}_{self._key}"
 
     @property
-    def native_value(self):
-        data = self.coordinator.data or {}
-        opts = self.coordinator.entry.options or {}
-        yen_per_kwh = float(opts.get(CONF_YEN_PER_KWH, DEFAULT_YEN_PER_KWH))
-
-        if self._key == "last_half_hour_w":
-            kwh = _safe_float(data.get("last_half_hour_kwh"))
-            if kwh is None:
-                return None
-            return round(kwh * 2000.0, 1)
-
-        if self._key == "today_cost_yen":
-            kwh = _safe_float(data.get("today_kwh"))
-            if kwh is None:
-                return None
-            return round(kwh * yen_per_kwh, 0)
-
-        if self._key == "month_to_date_cost_yen":
-            kwh = _safe_float(data.get("month_to_date_kwh"))
-            if kwh is None:
-                return None
-            return round(kwh * yen_per_kwh, 0)
-
-        return data.get(self._key)
+    def translation_key(self) -> str:
+        return self._key
 
     @property
-    def extra_state_attributes(self):
-        data = self.coordinator.data or {}
-        opts = self.coordinator.entry.options or {}
-        yen_per_kwh = float(opts.get(CONF_YEN_PER_KWH, DEFAULT_YEN_PER_KWH))
+    def device_class(self) -> SensorDeviceClass | None:
+        return self._sdef.device_class
+
+    @property
+    def state_class(self) -> SensorStateClass | None:
+        return self._sdef.state_class
+
+    @property
+    def native_unit_of_measurement(self) -> str | None:
+        return self._sdef.unit
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # Refresh the cached data once here instead of on every property read;
+        # options changes also arrive through this path.
+        self._data = self.coordinator.data or _EMPTY
+        self._attrs = self._build_attrs()
+        super()._handle_coordinator_update()
+
+    @property
+    def native_value(self):
+        # Power and cost values are precomputed by the coordinator.
+        return self._data.get(self._key)
+
+    def _build_attrs(self) -> Mapping[str, Any]:
+        data = self._data
+        if not data:
+            return _EMPTY
 
         attrs: dict[str, Any] = {
             "account_number": data.get("account_number"),
-            "yen_per_kwh": yen_per_kwh,
+            "yen_per_kwh": data.get("yen_per_kwh"),
         }
         if self._key in ("last_half_hour_kwh", "last_half_hour_w"):
             attrs["last_interval_end_jst"] = data.get("last_interval_end_jst")
-        return attrs
+        # Read-only, since the same mapping is handed out until the next update.
+        return MappingProxyType(attrs)
+
+    @property
+    def extra_state_attributes(self):
+        return self._attrs
 
 
 class OEJPCumulativeEnergy(CoordinatorEntity[OEJPCoordinator], RestoreEntity, SensorEntity):
-    _attr_name = "OEJP Energy total"
+    __slots__ = ("_total", "_last_end", "_last_end_s")
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "energy_total"
     _attr_device_class = SensorDeviceClass.ENERGY
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
     _attr_native_unit_of_measurement = "kWh"
@@ -122,6 +135,7 @@ class OEJPCumulativeEnergy(CoordinatorEntity[OEJPCoordinator], RestoreEntity, Se
         self._attr_unique_id = f"{coordinator.entry.entry_id}_energy_total"
         self._total: float | None = None
         self._last_end: str | None = None
+        self._last_end_s: int | None = None
 
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
@@ -135,7 +149,14 @@ class OEJPCumulativeEnergy(CoordinatorEntity[OEJPCoordinator], RestoreEntity, Se
             self._total = 0.0
 
         if last and last.attributes:
-            self._last_end = last.attributes.get("last_interval_end_jst")
+            last_end = last.attributes.get("last_interval_end_jst")
+            if isinstance(last_end, str):
+                try:
+                    self._last_end_s = int(datetime.fromisoformat(last_end).timestamp())
+                except ValueError:
+                    pass
+                else:
+                    self._last_end = last_end
 
     @property
     def native_value(self):
@@ -143,39 +164,36 @@ class OEJPCumulativeEnergy(CoordinatorEntity[OEJPCoordinator], RestoreEntity, Se
 
     @property
     def extra_state_attributes(self):
-        data = self.coordinator.data or {}
+        data = self.coordinator.data or _EMPTY
         return {
             "account_number": data.get("account_number"),
             "last_interval_end_jst": self._last_end,
         }
 
     def _apply_recent(self) -> None:
-        data = self.coordinator.data or {}
-        recent = data.get("recent_readings") or []
-        if not isinstance(recent, list):
+        data = self.coordinator.data or _EMPTY
+        # The API emits recent_end_s (epoch seconds, sorted), recent_ends (JST
+        # strings) and recent_kwhs (float) as parallel lists, so they are used
+        # without per-item type checks. Ordering uses the integer ends.
+        end_s = data.get("recent_end_s")
+        if not end_s:
             return
+        kwhs = data["recent_kwhs"]
 
         if self._total is None:
             self._total = 0.0
 
-        new_last_end = self._last_end
-
-        for item in recent:
-            if not isinstance(item, dict):
-                continue
-            end_jst = item.get("end_jst")
-            kwh = item.get("kwh")
-            if not isinstance(end_jst, str):
-                continue
-            if not isinstance(kwh, (int, float)):
-                continue
-
-            if self._last_end is None or end_jst > self._last_end:
-                self._total += float(kwh)
-                new_last_end = end_jst
+        start = 0
+        if self._last_end_s is not None:
+            if end_s[-1] <= self._last_end_s:
+                return
+            start = bisect_right(end_s, self._last_end_s)
 
-        self._last_end = new_last_end
+        self._total += sum(kwhs[start:])
+        self._last_end_s = end_s[-1]
+        self._last_end = data["recent_ends"][-1]
 
-    async def async_update(self) -> None:
-        await super().async_update()
+    @callback
+    def _handle_coordinator_update(self) -> None:
         self._apply_recent()
+        super()._handle_coordinator_update()